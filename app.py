@@ -1,9 +1,15 @@
+import os
 import streamlit as st
 import pandas as pd
 from datetime import datetime, date, timedelta
 import pytz
 import plotly.graph_objects as go
 import numpy as np
+from prediction_store import (
+    DAILY_PREDICTIONS_FILE, HORIZON_DIR, METRICS_FILE, PREDICTIONS_FILE, SCORING_SYSTEMS, TOP_PICKS,
+    aggregate_predictions, list_partition_dates, load_accuracy_metrics, partition_path,
+    published_predictions_file, read_predictions_range
+)
 
 st.set_page_config(
     page_title="NBA Stats Fantasy",
@@ -21,6 +27,24 @@ NBA_WHITE = "#FFFFFF"
 ALL_STAR_START = date(2026, 2, 13)
 ALL_STAR_END = date(2026, 2, 18)
 
+# Similar players index
+SIMILARITY_FILES = ['player_season.parquet', 'player_trend.parquet']
+SIMILARITY_EXCLUDED_STATS = ['GAMES PLAYED']
+SIMILARITY_BLOCK_SIZE = 4096
+
+# Pre-rendered page snapshots (one per data version and Paris date)
+GAMES_SNAPSHOT_FILES = ['season_schedule.parquet']
+LEADERS_SNAPSHOT_FILES = ['player_season.parquet']
+PREDICTIONS_SNAPSHOT_FILES = ['season_schedule.parquet', DAILY_PREDICTIONS_FILE]
+SNAPSHOT_MAX_ENTRIES = 14
+SEASON_LEADERS_STATS = {
+    'PTS': '🏀 Points',
+    'REB': '🔄 Rebounds',
+    'AST': '🎯 Assists',
+    'STL': '🖐️ Steals',
+    'BLK': '🚫 Blocks'
+}
+
 st.markdown(f"""
     <style>
         [data-testid="stSidebar"] {{
@@ -135,57 +159,63 @@ def format_game_display(row):
     
     return f"{time_str} - {away_team} @ {home_team} - {arena}"
 
-def get_today_games():
+@st.cache_data(show_spinner=False)
+def load_schedule(data_version):
+    """Season schedule with game times converted to Paris time (parsed once per data version)"""
+    df_schedule = pd.read_parquet('season_schedule.parquet')
+    df_schedule['Date'] = pd.to_datetime(df_schedule['Date'], format='mixed', dayfirst=True)
+    
+    def parse_et_time(statut, date):
+        try:
+            time_str = statut.replace(' ET', '').strip()
+            dt_str = f"{date.strftime('%Y-%m-%d')} {time_str}"
+            dt_et = pd.to_datetime(dt_str, format='%Y-%m-%d %I:%M %p')
+            eastern_tz = pytz.timezone('US/Eastern')
+            paris_tz = pytz.timezone('Europe/Paris')
+            dt_et_aware = eastern_tz.localize(dt_et)
+            dt_paris = dt_et_aware.astimezone(paris_tz)
+            return dt_paris
+        except:
+            return None
+    
+    df_schedule['Heure_paris'] = df_schedule.apply(
+        lambda row: parse_et_time(row['Statut'], row['Date']), axis=1
+    )
+    
+    return df_schedule
+
+def select_games_on(day):
+    # ALL STAR BREAK CHECK - stop immédiatement si on est pendant le break
+    if ALL_STAR_START <= day <= ALL_STAR_END:
+        return pd.DataFrame()  # Retour DataFrame vide
+    
+    df_schedule = load_schedule(get_data_version(['season_schedule.parquet']))
+    
+    games = df_schedule[df_schedule['Date'].dt.date == day].copy()
+    
+    if games.empty:
+        return pd.DataFrame()
+    
+    games = games.sort_values('Heure_paris')
+    
+    return games
+
+def get_games_on(day):
     try:
-        # ALL STAR BREAK CHECK - stop immédiatement si on est pendant le break
-        paris_tz = pytz.timezone('Europe/Paris')
-        today = datetime.now(paris_tz).date()
-        
-        if ALL_STAR_START <= today <= ALL_STAR_END:
-            return pd.DataFrame()  # Retour DataFrame vide
-        
-        df_schedule = pd.read_parquet('season_schedule.parquet')
-        df_schedule['Date'] = pd.to_datetime(df_schedule['Date'], format='mixed', dayfirst=True)
-        
-        def parse_et_time(statut, date):
-            try:
-                time_str = statut.replace(' ET', '').strip()
-                dt_str = f"{date.strftime('%Y-%m-%d')} {time_str}"
-                dt_et = pd.to_datetime(dt_str, format='%Y-%m-%d %I:%M %p')
-                eastern_tz = pytz.timezone('US/Eastern')
-                paris_tz = pytz.timezone('Europe/Paris')
-                dt_et_aware = eastern_tz.localize(dt_et)
-                dt_paris = dt_et_aware.astimezone(paris_tz)
-                return dt_paris
-            except:
-                return None
-        
-        df_schedule['Heure_paris'] = df_schedule.apply(
-            lambda row: parse_et_time(row['Statut'], row['Date']), axis=1
-        )
-        
-        now_paris = datetime.now(pytz.timezone('Europe/Paris'))
-        today_paris = now_paris.date()
-        
-        today_games = df_schedule[df_schedule['Date'].dt.date == today_paris].copy()
-        
-        if today_games.empty:
-            return pd.DataFrame()
-        
-        today_games = today_games.sort_values('Heure_paris')
-        
-        return today_games
+        return select_games_on(day)
     except Exception as e:
         st.error(f"❌ Error loading schedule: {str(e)}")
         return pd.DataFrame()
 
-def get_first_game_time():
-    today_games = get_today_games()
-    if not today_games.empty and 'Heure_paris' in today_games.columns:
-        first_time = today_games.iloc[0]['Heure_paris']
+def format_first_game_time(games):
+    if not games.empty and 'Heure_paris' in games.columns:
+        first_time = games.iloc[0]['Heure_paris']
         return first_time.strftime('%H:%M')
     return None
 
+def get_first_game_time(day):
+    return format_first_game_time(get_games_on(day))
+
 def create_radar_chart(player1_data, player2_data, categories, title, player1_name, player2_name, is_percentage=False):
     """Create a radar chart comparing two players"""
     
@@ -285,6 +315,154 @@ def normalize_percentage(value, max_val=100):
     """Normalize percentage values for radar chart"""
     return min(value, max_val)
 
+def get_data_version(files):
+    """Return a key that changes whenever one of the data files is updated"""
+    return tuple(os.path.getmtime(f) if os.path.exists(f) else None for f in files)
+
+@st.cache_data(show_spinner=False)
+def load_accuracy_metrics_cached(data_version):
+    """Accuracy metrics, reloaded only when the metrics file changes"""
+    return load_accuracy_metrics()
+
+@st.cache_resource(show_spinner=False, max_entries=1)
+def build_similarity_index(data_version):
+    """Build the nearest-neighbor index over standardized season and trend stats (once per data version)"""
+    df = pd.read_parquet('player_season.parquet')
+    if os.path.exists('player_trend.parquet'):
+        df_trend = pd.read_parquet('player_trend.parquet')
+        df = df.merge(df_trend, on=['PLAYER', 'TEAM'], how='left')
+    df = df.drop_duplicates('PLAYER').reset_index(drop=True)
+    
+    stat_cols = [col for col in df.select_dtypes(include='number').columns if col not in SIMILARITY_EXCLUDED_STATS]
+    values = df[stat_cols].astype(float)
+    mean = values.mean()
+    std = values.std(ddof=0).replace(0, 1).fillna(1)
+    
+    # Z-scores (missing trends = league average), then unit rows so a dot product is a cosine similarity
+    zscores = ((values - mean) / std).fillna(0).to_numpy(dtype=np.float32)
+    norms = np.linalg.norm(zscores, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    
+    return {
+        'players': df['PLAYER'].to_numpy(),
+        'teams': df['TEAM'].to_numpy(),
+        'positions': {player: idx for idx, player in enumerate(df['PLAYER'])},
+        'stats': stat_cols,
+        'mean': mean,
+        'std': std,
+        'zscores': zscores,
+        'matrix': zscores / norms
+    }
+
+def top_similar_players(index, scores, k=5, exclude=None):
+    """Top-K rows of the index by similarity score (0-1)"""
+    if exclude is not None:
+        scores[exclude] = -np.inf
+    
+    k = min(k, len(scores) - (exclude is not None))
+    if k <= 0:
+        return pd.DataFrame(columns=['PLAYER', 'TEAM', 'SIMILARITY (%)'])
+    
+    top = np.argpartition(-scores, k - 1)[:k]
+    top = top[np.argsort(-scores[top])]
+    
+    return pd.DataFrame({
+        'PLAYER': index['players'][top],
+        'TEAM': index['teams'][top],
+        'SIMILARITY (%)': np.round(scores[top].astype(float) * 100, 1)
+    })
+
+def get_similar_players(index, player, k=5):
+    """Top-K most statistically similar players to a given player (cosine similarity over all stats)"""
+    position = index['positions'].get(player)
+    if position is None:
+        return pd.DataFrame(columns=['PLAYER', 'TEAM', 'SIMILARITY (%)'])
+    
+    matrix = index['matrix']
+    vector = matrix[position]
+    scores = np.empty(len(matrix), dtype=np.float32)
+    for start in range(0, len(matrix), SIMILARITY_BLOCK_SIZE):
+        scores[start:start + SIMILARITY_BLOCK_SIZE] = matrix[start:start + SIMILARITY_BLOCK_SIZE] @ vector
+    
+    return top_similar_players(index, scores, k=k, exclude=position)
+
+def get_similar_to_profile(index, profile, k=5):
+    """Top-K players closest to a stat profile, e.g. {'PTS': 20, 'AST': 8}, compared on those stats only
+    
+    Similarity = 1 / (1 + RMS distance between z-scores), so 100% is an exact match.
+    """
+    stats = [stat for stat in profile if stat in index['stats']]
+    if not stats:
+        return pd.DataFrame(columns=['PLAYER', 'TEAM', 'SIMILARITY (%)'])
+    
+    columns = [index['stats'].index(stat) for stat in stats]
+    values = pd.Series({stat: profile[stat] for stat in stats}, dtype=float)
+    vector = ((values - index['mean'][stats]) / index['std'][stats]).to_numpy(dtype=np.float32)
+    
+    zscores = index['zscores']
+    scores = np.empty(len(zscores), dtype=np.float32)
+    for start in range(0, len(zscores), SIMILARITY_BLOCK_SIZE):
+        block = zscores[start:start + SIMILARITY_BLOCK_SIZE][:, columns]
+        # ||a - b||² = ||a||² - 2 a·b + ||b||²
+        sq_dist = (block ** 2).sum(axis=1) - 2 * (block @ vector) + vector @ vector
+        rms = np.sqrt(np.maximum(sq_dist, 0) / len(columns))
+        scores[start:start + SIMILARITY_BLOCK_SIZE] = 1 / (1 + rms)
+    
+    return top_similar_players(index, scores, k=k)
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_MAX_ENTRIES)
+def build_games_snapshot(data_version, paris_date):
+    """Home page game cards, computed once per schedule version and Paris date then served to every visitor
+    
+    Load errors are raised, not stored, so a failed read is never served from the snapshot.
+    """
+    snapshot = {
+        'all_star_break': ALL_STAR_START <= paris_date <= ALL_STAR_END,
+        'next_game_date': ALL_STAR_END + timedelta(days=1),
+        'games': []
+    }
+    
+    if not snapshot['all_star_break']:
+        today_games = select_games_on(paris_date)
+        snapshot['games'] = [format_game_display(game) for _, game in today_games.iterrows()]
+    
+    return snapshot
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_MAX_ENTRIES)
+def build_leaders_snapshot(data_version):
+    """Home page season leaders tables, computed once per season stats version (errors raised, not stored)"""
+    df_season = pd.read_parquet('player_season.parquet')
+    leaders = {}
+    for stat_col in SEASON_LEADERS_STATS:
+        if stat_col in df_season.columns:
+            top_5 = df_season.nlargest(5, stat_col)[['PLAYER', stat_col]]
+            leaders[stat_col] = top_5.reset_index(drop=True)
+        else:
+            leaders[stat_col] = None
+    return leaders
+
+@st.cache_data(show_spinner=False, max_entries=SNAPSHOT_MAX_ENTRIES)
+def build_predictions_snapshot(data_version, paris_date, day):
+    """Fantasy Predictions view model for a single day, computed once per data version and Paris date (errors raised, not stored)"""
+    if day == paris_date:
+        # Same file the morning job archives for the accuracy metrics
+        df = pd.read_parquet(published_predictions_file(day))
+    else:
+        df = read_predictions_range(day, day).drop(columns='Date', errors='ignore')
+    
+    if 'Score TTFL' in df.columns:
+        df = df.sort_values('Score TTFL', ascending=False).reset_index(drop=True)
+    
+    return {
+        'deadline': format_first_game_time(select_games_on(day)),
+        'predictions': df
+    }
+
+def get_predictions_snapshot(paris_date, day):
+    """Serve the single day predictions snapshot, rebuilt when its source files change"""
+    files = PREDICTIONS_SNAPSHOT_FILES + [os.path.join(partition_path(day, HORIZON_DIR), PREDICTIONS_FILE)]
+    return build_predictions_snapshot(get_data_version(files), paris_date, day)
+
 if st.session_state.page == "🏠 Home":
     st.title("🏀 NBA Stats Fantasy")
     
@@ -294,44 +472,33 @@ if st.session_state.page == "🏠 Home":
     st.markdown("---")
     st.markdown("### 🏀 Today's Games")
     
-    # Check All-Star break AVANT d'appeler get_today_games()
-    if ALL_STAR_START <= current_time.date() <= ALL_STAR_END:
-        next_game_date = ALL_STAR_END + timedelta(days=1)
-        st.info(f"🌟 ALL STAR GAME IN LOS ANGELES. Next game on {next_game_date.strftime('%b %d')}.")
-    else:
-        today_games = get_today_games()
+    try:
+        games_snapshot = build_games_snapshot(get_data_version(GAMES_SNAPSHOT_FILES), current_time.date())
         
-        if not today_games.empty:
-            for _, game in today_games.iterrows():
-                game_display = format_game_display(game)
+        if games_snapshot['all_star_break']:
+            st.info(f"🌟 ALL STAR GAME IN LOS ANGELES. Next game on {games_snapshot['next_game_date'].strftime('%b %d')}.")
+        elif games_snapshot['games']:
+            for game_display in games_snapshot['games']:
                 st.markdown(f"<div style='background-color: {NBA_WHITE}; border: 1px solid {NBA_BLUE}; border-radius: 5px; padding: 8px; margin: 5px 0; text-align: center;'><p style='color: {NBA_BLUE}; margin: 0; font-size: 14px;'>{game_display}</p></div>", 
                            unsafe_allow_html=True)
         else:
             st.info("No games scheduled for today")
+    except Exception as e:
+        st.error(f"❌ Error loading schedule: {str(e)}")
     
     st.markdown("---")
     st.markdown("### 📊 Season Leaders")
     
     try:
-        df_season = pd.read_parquet('player_season.parquet')
-        
-        stats = {
-            'PTS': '🏀 Points',
-            'REB': '🔄 Rebounds',
-            'AST': '🎯 Assists',
-            'STL': '🖐️ Steals',
-            'BLK': '🚫 Blocks'
-        }
+        leaders = build_leaders_snapshot(get_data_version(LEADERS_SNAPSHOT_FILES))
         
         cols = st.columns(5)
         
-        for idx, (stat_col, stat_title) in enumerate(stats.items()):
+        for idx, (stat_col, stat_title) in enumerate(SEASON_LEADERS_STATS.items()):
             with cols[idx]:
                 st.markdown(f"**{stat_title}**")
-                if stat_col in df_season.columns:
-                    top_5 = df_season.nlargest(5, stat_col)[['PLAYER', stat_col]]
-                    top_5 = top_5.reset_index(drop=True)
-                    st.dataframe(top_5, use_container_width=True, height=220, hide_index=True)
+                if leaders[stat_col] is not None:
+                    st.dataframe(leaders[stat_col], use_container_width=True, height=220, hide_index=True)
                 else:
                     st.warning(f"{stat_col} not found")
     except Exception as e:
@@ -667,6 +834,47 @@ elif st.session_state.page == "⚔️ Player VS":
                 
                 st.dataframe(df_comparison, use_container_width=True, hide_index=True)
                 
+                # Similar players (waiver and trade targets)
+                st.markdown("---")
+                st.subheader("🔍 Similar Players")
+                
+                similarity_index = build_similarity_index(get_data_version(SIMILARITY_FILES))
+                
+                col1, col2 = st.columns(2)
+                
+                with col1:
+                    st.markdown(f"<h4 style='color: {NBA_BLUE}; text-align: center;'>Closest to {player1}</h4>", unsafe_allow_html=True)
+                    st.dataframe(get_similar_players(similarity_index, player1), use_container_width=True, hide_index=True)
+                
+                with col2:
+                    st.markdown(f"<h4 style='color: {NBA_RED}; text-align: center;'>Closest to {player2}</h4>", unsafe_allow_html=True)
+                    st.dataframe(get_similar_players(similarity_index, player2), use_container_width=True, hide_index=True)
+                
+                st.caption("🔍 Cosine similarity over standardized season stats and recent trends")
+                
+                with st.expander("🧪 Find players by stat profile"):
+                    profile_stats = st.multiselect(
+                        "Stats",
+                        similarity_index['stats'],
+                        default=[stat for stat in ['PTS', 'REB', 'AST'] if stat in similarity_index['stats']],
+                        key="profile_stats"
+                    )
+                    
+                    if profile_stats:
+                        profile = {}
+                        cols = st.columns(min(len(profile_stats), 5))
+                        for idx, stat in enumerate(profile_stats):
+                            with cols[idx % len(cols)]:
+                                profile[stat] = st.number_input(
+                                    stat,
+                                    value=round(float(similarity_index['mean'][stat]), 1),
+                                    step=0.5,
+                                    key=f"profile_{stat}"
+                                )
+                        
+                        st.dataframe(get_similar_to_profile(similarity_index, profile, k=10), use_container_width=True, hide_index=True)
+                        st.caption("🧪 Similarity on the selected stats only (100% = exact match)")
+                
     except Exception as e:
         st.error(f"❌ Error loading player data: {str(e)}")
 
@@ -703,34 +911,112 @@ elif st.session_state.page == "🏥 Injuries":
 elif st.session_state.page == "🔮 Fantasy Predictions":
     st.title("🔮 Fantasy Predictions")
     
-    first_game_time = get_first_game_time()
-    if first_game_time:
-        st.markdown(f"### ⏰ Deadline: {first_game_time} (first game of the day)")
+    tab1, tab2 = st.tabs(["📋 Predictions", "🎯 Accuracy"])
     
-    try:
-        df = pd.read_parquet('fantasy_daily_predictions.parquet')
-        
-        filter_cols = [col for col in df.columns if 'PLAYER' in col.upper() or 'TEAM' in col.upper()]
+    with tab1:
+        today = get_french_time().date()
+        horizon_dates = [day for day in list_partition_dates(HORIZON_DIR) if day >= today]
+        
+        start_date, end_date = today, today
+        if horizon_dates:
+            selected_dates = st.date_input(
+                "📅 Game days",
+                value=(horizon_dates[0], horizon_dates[0]),
+                min_value=today,
+                max_value=horizon_dates[-1],
+                key="fantasy_dates"
+            )
+            # Single date while the end of the range is being picked
+            if isinstance(selected_dates, (tuple, list)):
+                start_date, end_date = selected_dates[0], selected_dates[-1]
+            else:
+                start_date, end_date = selected_dates, selected_dates
         
-        if filter_cols:
-            cols = st.columns(len(filter_cols))
-            filters = {}
-            for idx, col in enumerate(filter_cols):
-                with cols[idx]:
-                    unique_values = ['All'] + sorted(df[col].dropna().unique().tolist())
-                    filters[col] = st.selectbox(f"{col}", unique_values, key=f"fantasy_{col}")
+        try:
+            # Deadline = first game of each day
+            if start_date == end_date:
+                snapshot = get_predictions_snapshot(today, start_date)
+                if snapshot['deadline']:
+                    st.markdown(f"### ⏰ Deadline: {snapshot['deadline']} (first game of the day)")
+                df = snapshot['predictions']
+            else:
+                game_days = [day for day in horizon_dates if start_date <= day <= end_date]
+                df_deadlines = pd.DataFrame({
+                    'DATE': [day.strftime('%a %b %d') for day in game_days],
+                    'DEADLINE': [get_first_game_time(day) or '-' for day in game_days]
+                })
+                st.markdown("### ⏰ Deadlines (first game of each day)")
+                st.dataframe(df_deadlines, hide_index=True)
+                
+                df = read_predictions_range(start_date, end_date)
+                if not df.empty:
+                    # Expected output per player over the range
+                    df = aggregate_predictions(df)
             
-            filtered_df = df.copy()
-            for col, filter_val in filters.items():
-                if filter_val and filter_val != 'All':
-                    filtered_df = filtered_df[filtered_df[col] == filter_val]
-        else:
-            filtered_df = df
-        
-        st.dataframe(filtered_df, use_container_width=True, height=600, hide_index=True)
-        
-        st.markdown("---")
-        st.caption("🔮 **Data Source:** Prediction model based on NBA statistics | Generated daily")
+            if df.empty:
+                st.info("No predictions available for the selected dates")
+            
+            filter_cols = [col for col in df.columns if 'PLAYER' in col.upper() or 'TEAM' in col.upper()]
+            
+            if filter_cols:
+                cols = st.columns(len(filter_cols))
+                filters = {}
+                for idx, col in enumerate(filter_cols):
+                    with cols[idx]:
+                        unique_values = ['All'] + sorted(df[col].dropna().unique().tolist())
+                        filters[col] = st.selectbox(f"{col}", unique_values, key=f"fantasy_{col}")
+                
+                filtered_df = df.copy()
+                for col, filter_val in filters.items():
+                    if filter_val and filter_val != 'All':
+                        filtered_df = filtered_df[filtered_df[col] == filter_val]
+            else:
+                filtered_df = df
+            
+            st.dataframe(filtered_df, use_container_width=True, height=600, hide_index=True)
+            
+            st.markdown("---")
+            st.caption("🔮 **Data Source:** Prediction model based on NBA statistics | Generated daily")
+            
+        except Exception as e:
+            st.error(f"❌ Error loading data: {str(e)}")
+    
+    with tab2:
+        st.subheader("🎯 Prediction Accuracy")
         
-    except Exception as e:
-        st.error(f"❌ Error loading data: {str(e)}")
\ No newline at end of file
+        try:
+            df_metrics = load_accuracy_metrics_cached(get_data_version([METRICS_FILE]))
+            
+            if df_metrics.empty:
+                st.info("No realized scores archived yet")
+            else:
+                system = st.radio("Scoring system", list(SCORING_SYSTEMS.keys()), horizontal=True, key="accuracy_system")
+                df_system = df_metrics[df_metrics['SYSTEM'] == system]
+                
+                overall = df_system[df_system['LEVEL'] == 'SYSTEM']
+                if not overall.empty:
+                    overall = overall.iloc[0]
+                    col1, col2, col3, col4 = st.columns(4)
+                    col1.metric("Player-games", int(overall['GAMES']), help=f"{int(overall['MISSING RESULTS'])} without a realized score (counted as 0)")
+                    col2.metric("MAE", f"{overall['MAE']:.2f}")
+                    col3.metric("Rank correlation", f"{overall['RANK CORR']:.3f}" if pd.notna(overall['RANK CORR']) else "N/A")
+                    col4.metric(f"Top {TOP_PICKS} hit rate", f"{overall['HIT RATE (%)']:.1f}%" if pd.notna(overall['HIT RATE (%)']) else "N/A")
+                
+                display_cols = ['KEY', 'GAMES', 'MISSING RESULTS', 'MAE', 'RANK CORR', 'TOP PICKS', 'HIT RATE (%)']
+                
+                st.markdown("#### 🏀 By Team")
+                df_team = df_system[df_system['LEVEL'] == 'TEAM'][display_cols].rename(columns={'KEY': 'TEAM'})
+                st.dataframe(df_team.sort_values('MAE'), use_container_width=True, height=400, hide_index=True)
+                
+                st.markdown("#### 👤 By Player")
+                df_player = df_system[df_system['LEVEL'] == 'PLAYER'][display_cols].drop(columns='RANK CORR').rename(columns={'KEY': 'PLAYER'})
+                player_filter = st.selectbox("PLAYER", ['All'] + sorted(df_player['PLAYER'].tolist()), key="accuracy_player")
+                if player_filter != 'All':
+                    df_player = df_player[df_player['PLAYER'] == player_filter]
+                st.dataframe(df_player.sort_values('MAE'), use_container_width=True, height=400, hide_index=True)
+            
+            st.markdown("---")
+            st.caption("🎯 **Data Source:** Archived daily predictions vs realized fantasy scores | Updated daily")
+            
+        except Exception as e:
+            st.error(f"❌ Error loading accuracy metrics: {str(e)}")
@@ -0,0 +1,324 @@
+"""Date-partitioned stores of fantasy predictions and realized scores.
+
+History layout (append-only, one partition per day, never rewritten once written):
+
+    prediction_history/
+    ├── date=2026-03-01/
+    │   ├── predictions.parquet     # predictions shown that morning (see published_predictions_file)
+    │   └── results.parquet         # realized scores (Player, Team, Score TTFL, Score SORARE)
+    └── accuracy_metrics.parquet    # running sums per player / team / scoring system,
+                                    # ingested dates kept in the same file (schema metadata)
+
+Accuracy metrics are kept as running sums, so each update only reads the new
+partitions and the dashboard only reads one small file, however many days are stored.
+Predicted players without a realized score (late scratches, DNPs) count as 0 and are
+tracked in MISSING RESULTS.
+
+Upcoming predictions live in a separate date-partitioned dataset, rewritten every
+morning for the next N game days of the schedule:
+
+    fantasy_predictions/
+    └── date=2026-03-02/predictions.parquet
+
+Morning job:
+    python prediction_store.py predictions --date 2026-03-02
+    python prediction_store.py results --date 2026-03-01 --file results.parquet
+    python prediction_store.py horizon --file horizon_predictions.parquet
+"""
+import argparse
+import json
+import os
+import shutil
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+HISTORY_DIR = 'prediction_history'
+METRICS_FILE = os.path.join(HISTORY_DIR, 'accuracy_metrics.parquet')
+METRICS_STATE_KEY = b'ingested_dates'
+PREDICTIONS_FILE = 'predictions.parquet'
+RESULTS_FILE = 'results.parquet'
+HORIZON_DIR = 'fantasy_predictions'
+DAILY_PREDICTIONS_FILE = 'fantasy_daily_predictions.parquet'
+HORIZON_DAYS = 7
+
+SCORING_SYSTEMS = {'TTFL': 'Score TTFL', 'SORARE': 'Score SORARE'}
+KEY_COLS = ['Player', 'Team']
+TOP_PICKS = 10
+MIN_RANK_PLAYERS = 3
+
+METRIC_KEYS = ['LEVEL', 'KEY', 'SYSTEM']
+METRIC_SUMS = ['GAMES', 'MISSING RESULTS', 'ABS ERROR SUM', 'TOP PICKS', 'TOP HITS', 'RANK CORR SUM', 'RANK CORR DAYS']
+
+
+def partition_path(day, root=HISTORY_DIR):
+    """Directory of the partition for a given day"""
+    return os.path.join(root, f"date={pd.Timestamp(day).date().isoformat()}")
+
+
+def list_partition_dates(root=HISTORY_DIR):
+    """Sorted dates of the partitions present in a partitioned dataset"""
+    if not os.path.isdir(root):
+        return []
+    dates = []
+    for name in os.listdir(root):
+        if name.startswith('date=') and os.path.isdir(os.path.join(root, name)):
+            try:
+                dates.append(date.fromisoformat(name[len('date='):]))
+            except ValueError:
+                continue
+    return sorted(dates)
+
+
+def _write_parquet_once(df, path):
+    """Write a parquet file atomically, refusing to overwrite (append-only store)"""
+    if os.path.exists(path):
+        raise FileExistsError(f"{path} already exists, partitions are append-only")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def append_predictions(day, df_predictions, root=HISTORY_DIR):
+    """Archive the predictions published for a given day"""
+    _write_parquet_once(df_predictions, os.path.join(partition_path(day, root), PREDICTIONS_FILE))
+
+
+def append_results(day, df_results, root=HISTORY_DIR):
+    """Archive the realized fantasy scores for a given day"""
+    _write_parquet_once(df_results, os.path.join(partition_path(day, root), RESULTS_FILE))
+
+
+def _rank_corr(predicted, actual):
+    """Spearman rank correlation, None when undefined"""
+    if len(predicted) < MIN_RANK_PLAYERS:
+        return None
+    corr = predicted.rank().corr(actual.rank())
+    return None if pd.isna(corr) else float(corr)
+
+
+def compute_partition_metrics(df_predictions, df_results):
+    """Sums of accuracy metrics for one day, per player, team and scoring system"""
+    if df_predictions.empty:
+        return pd.DataFrame(columns=METRIC_KEYS + METRIC_SUMS)
+
+    df = df_predictions.merge(df_results, on=KEY_COLS, how='left', suffixes=(' PRED', ' REAL'), indicator=True)
+    df['MISSING'] = df['_merge'] == 'left_only'
+    rows = []
+
+    for system, score_col in SCORING_SYSTEMS.items():
+        pred_col = f"{score_col} PRED"
+        real_col = f"{score_col} REAL"
+        if pred_col not in df.columns or real_col not in df.columns:
+            continue
+
+        # No realized row = player did not play, i.e. 0 fantasy points
+        day = df[KEY_COLS + [pred_col, real_col, 'MISSING']].dropna(subset=[pred_col])
+        day[real_col] = day[real_col].fillna(0)
+        if day.empty:
+            continue
+
+        top_n = min(TOP_PICKS, len(day))
+        day = day.assign(
+            ABS_ERROR=(day[pred_col] - day[real_col]).abs(),
+            TOP_PICK=day[pred_col].rank(method='first', ascending=False) <= top_n,
+            TOP_REAL=day[real_col].rank(method='min', ascending=False) <= top_n
+        )
+        day['TOP_HIT'] = day['TOP_PICK'] & day['TOP_REAL']
+
+        groups = [('SYSTEM', pd.Series(system, index=day.index)), ('TEAM', day['Team']), ('PLAYER', day['Player'])]
+        for level, keys in groups:
+            for key, group in day.groupby(keys, sort=False):
+                corr = _rank_corr(group[pred_col], group[real_col]) if level != 'PLAYER' else None
+                rows.append({
+                    'LEVEL': level,
+                    'KEY': key,
+                    'SYSTEM': system,
+                    'GAMES': len(group),
+                    'MISSING RESULTS': int(group['MISSING'].sum()),
+                    'ABS ERROR SUM': float(group['ABS_ERROR'].sum()),
+                    'TOP PICKS': int(group['TOP_PICK'].sum()),
+                    'TOP HITS': int(group['TOP_HIT'].sum()),
+                    'RANK CORR SUM': corr if corr is not None else 0.0,
+                    'RANK CORR DAYS': 1 if corr is not None else 0
+                })
+
+    return pd.DataFrame(rows, columns=METRIC_KEYS + METRIC_SUMS)
+
+
+def _read_metrics(metrics_file):
+    """Running metrics and the dates already folded into them"""
+    if not os.path.exists(metrics_file):
+        return pd.DataFrame(columns=METRIC_KEYS + METRIC_SUMS), set()
+    table = pq.read_table(metrics_file)
+    metadata = table.schema.metadata or {}
+    ingested = set(json.loads(metadata.get(METRICS_STATE_KEY, b'[]')))
+    metrics = table.to_pandas().reindex(columns=METRIC_KEYS + METRIC_SUMS, fill_value=0)
+    return metrics, ingested
+
+
+def _write_metrics(metrics, ingested, metrics_file):
+    """Atomically replace the metrics together with the ingested dates, so a crash never double counts a day"""
+    table = pa.Table.from_pandas(metrics, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[METRICS_STATE_KEY] = json.dumps(sorted(ingested)).encode()
+    tmp_path = f"{metrics_file}.tmp"
+    pq.write_table(table.replace_schema_metadata(metadata), tmp_path)
+    os.replace(tmp_path, metrics_file)
+
+
+def update_accuracy_metrics(root=HISTORY_DIR):
+    """Fold the partitions not yet ingested (with both predictions and results) into the running metrics"""
+    metrics_file = os.path.join(root, os.path.basename(METRICS_FILE))
+    metrics, ingested = _read_metrics(metrics_file)
+
+    new_dates = [
+        day for day in list_partition_dates(root)
+        if day.isoformat() not in ingested
+        and os.path.exists(os.path.join(partition_path(day, root), PREDICTIONS_FILE))
+        and os.path.exists(os.path.join(partition_path(day, root), RESULTS_FILE))
+    ]
+    if not new_dates:
+        return []
+
+    frames = [metrics]
+    for day in new_dates:
+        folder = partition_path(day, root)
+        frames.append(compute_partition_metrics(
+            pd.read_parquet(os.path.join(folder, PREDICTIONS_FILE)),
+            pd.read_parquet(os.path.join(folder, RESULTS_FILE))
+        ))
+
+    # Empty slates (no games, All-Star break) add nothing but are still marked as ingested
+    frames = [frame for frame in frames if not frame.empty]
+    if frames:
+        metrics = pd.concat(frames, ignore_index=True).groupby(METRIC_KEYS, as_index=False)[METRIC_SUMS].sum()
+    else:
+        metrics = pd.DataFrame(columns=METRIC_KEYS + METRIC_SUMS)
+
+    _write_metrics(metrics, ingested | {day.isoformat() for day in new_dates}, metrics_file)
+    return new_dates
+
+
+def load_accuracy_metrics(root=HISTORY_DIR):
+    """Running metrics with derived MAE, rank correlation and top-pick hit rate"""
+    metrics_file = os.path.join(root, os.path.basename(METRICS_FILE))
+    display_cols = METRIC_KEYS + ['GAMES', 'MISSING RESULTS', 'MAE', 'RANK CORR', 'TOP PICKS', 'HIT RATE (%)']
+    if not os.path.exists(metrics_file):
+        return pd.DataFrame(columns=display_cols)
+
+    metrics, _ = _read_metrics(metrics_file)
+    metrics['MAE'] = (metrics['ABS ERROR SUM'] / metrics['GAMES']).round(2)
+    metrics['RANK CORR'] = (metrics['RANK CORR SUM'] / metrics['RANK CORR DAYS'].replace(0, np.nan)).round(3)
+    metrics['HIT RATE (%)'] = (100 * metrics['TOP HITS'] / metrics['TOP PICKS'].replace(0, np.nan)).round(1)
+    return metrics[display_cols]
+
+
+def get_paris_date():
+    """Today's date in Paris, the reference day of the whole app"""
+    return pd.Timestamp.now(tz='Europe/Paris').date()
+
+
+def get_horizon_dates(df_schedule, start=None, n_days=HORIZON_DAYS):
+    """Game days of the schedule within the next N days (start included, default: today in Paris)"""
+    start = pd.Timestamp(start or get_paris_date()).date()
+    game_dates = pd.to_datetime(df_schedule['Date'], format='mixed', dayfirst=True).dt.date
+    return sorted(day for day in game_dates.unique() if start <= day < start + timedelta(days=n_days))
+
+
+def write_horizon_predictions(df_predictions, root=HORIZON_DIR):
+    """Rewrite the dataset from predictions with a 'Date' column, dropping every day not in them"""
+    if df_predictions.empty:
+        raise ValueError("No horizon predictions to write, keeping the existing dataset")
+    dates = pd.to_datetime(df_predictions['Date']).dt.date
+
+    written = []
+    for day, df_day in df_predictions.drop(columns='Date').groupby(dates.to_numpy()):
+        path = os.path.join(partition_path(day, root), PREDICTIONS_FILE)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        df_day.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        written.append(day)
+
+    # Once every new day is written: past days, postponed games or a shorter horizon
+    # must not linger in the range totals
+    for day in list_partition_dates(root):
+        if day not in written:
+            shutil.rmtree(partition_path(day, root))
+
+    return written
+
+
+def read_predictions_range(start, end, root=HORIZON_DIR):
+    """Predictions of the days between start and end (included), reading only those partitions"""
+    start, end = pd.Timestamp(start).date(), pd.Timestamp(end).date()
+    frames = []
+    for day in list_partition_dates(root):
+        if start <= day <= end:
+            try:
+                df_day = pd.read_parquet(os.path.join(partition_path(day, root), PREDICTIONS_FILE))
+            except FileNotFoundError:
+                continue  # pruned by the morning job while listing
+            frames.append(df_day.assign(Date=day))
+    if not frames:
+        return pd.DataFrame()
+    return pd.concat(frames, ignore_index=True)
+
+
+def aggregate_predictions(df_range):
+    """Expected fantasy output per player over a date range"""
+    score_cols = [col for col in SCORING_SYSTEMS.values() if col in df_range.columns]
+    grouped = df_range.groupby(KEY_COLS, as_index=False)
+    df = grouped.agg(Games=('Date', 'nunique'), **{f"Total {col}": (col, 'sum') for col in score_cols})
+    for col in score_cols:
+        df[f"Avg {col}"] = (df[f"Total {col}"] / df['Games']).round(1)
+    sort_col = f"Total {score_cols[0]}" if score_cols else 'Games'
+    return df.sort_values(sort_col, ascending=False).reset_index(drop=True)
+
+
+def published_predictions_file(day, root=HORIZON_DIR):
+    """File the app shows for a day: its horizon partition, else the flat daily file"""
+    path = os.path.join(partition_path(day, root), PREDICTIONS_FILE)
+    return path if os.path.exists(path) else DAILY_PREDICTIONS_FILE
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Store daily fantasy predictions and realized scores")
+    parser.add_argument('kind', choices=['predictions', 'results', 'horizon'])
+    parser.add_argument('--date', default=get_paris_date().isoformat(), help="Slate date, first day of the horizon (YYYY-MM-DD)")
+    parser.add_argument('--file', help="Parquet file to store (default for predictions: the file shown by the app that day)")
+    parser.add_argument('--days', type=int, default=HORIZON_DAYS, help="Horizon length in days")
+    args = parser.parse_args()
+
+    if args.kind == 'horizon':
+        if not args.file:
+            parser.error("--file is required for horizon")
+        df_predictions = pd.read_parquet(args.file)
+        horizon_dates = get_horizon_dates(pd.read_parquet('season_schedule.parquet'), args.date, args.days)
+        in_horizon = pd.to_datetime(df_predictions['Date']).dt.date.isin(horizon_dates)
+        if not in_horizon.any():
+            parser.error(f"no predictions within the {args.days} days schedule horizon from {args.date}")
+        if not in_horizon.all():
+            print(f"Skipping {int((~in_horizon).sum())} predictions outside the {args.days} days schedule horizon")
+        for day in write_horizon_predictions(df_predictions[in_horizon]):
+            print(f"Predictions written for {day.isoformat()}")
+        return
+
+    if args.kind == 'predictions':
+        append_predictions(args.date, pd.read_parquet(args.file or published_predictions_file(args.date)))
+    else:
+        if not args.file:
+            parser.error("--file is required for results")
+        append_results(args.date, pd.read_parquet(args.file))
+
+    for day in update_accuracy_metrics():
+        print(f"Accuracy metrics updated with {day.isoformat()}")
+
+
+if __name__ == '__main__':
+    main()
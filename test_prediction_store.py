@@ -0,0 +1,138 @@
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+import prediction_store as ps
+
+
+def make_predictions(scores):
+    """Predictions frame from {player: (team, ttfl, sorare)}"""
+    return pd.DataFrame(
+        [(player, team, ttfl, sorare) for player, (team, ttfl, sorare) in scores.items()],
+        columns=['Player', 'Team', 'Score TTFL', 'Score SORARE']
+    )
+
+
+PREDICTIONS = make_predictions({
+    'Jokic': ('Denver Nuggets', 50, 55),
+    'Murray': ('Denver Nuggets', 30, 32),
+    'Doncic': ('Los Angeles Lakers', 48, 50),
+    'James': ('Los Angeles Lakers', 35, 36),
+})
+
+RESULTS = make_predictions({
+    'Jokic': ('Denver Nuggets', 60, 55),
+    'Murray': ('Denver Nuggets', 20, 30),
+    'Doncic': ('Los Angeles Lakers', 40, 50),
+})
+
+
+def metric(metrics, level, key, system, col):
+    row = metrics[(metrics['LEVEL'] == level) & (metrics['KEY'] == key) & (metrics['SYSTEM'] == system)]
+    return row.iloc[0][col]
+
+
+def test_partitions_are_append_only(tmp_path):
+    ps.append_predictions('2026-03-01', PREDICTIONS, root=tmp_path)
+    with pytest.raises(FileExistsError):
+        ps.append_predictions('2026-03-01', PREDICTIONS, root=tmp_path)
+    assert ps.list_partition_dates(tmp_path) == [pd.Timestamp('2026-03-01').date()]
+
+
+def test_missing_results_count_as_zero(monkeypatch):
+    monkeypatch.setattr(ps, 'TOP_PICKS', 2)
+    metrics = ps.compute_partition_metrics(PREDICTIONS, RESULTS)
+
+    # James has no realized row: |35 - 0| joins the errors and is counted as missing
+    assert metric(metrics, 'SYSTEM', 'TTFL', 'TTFL', 'GAMES') == 4
+    assert metric(metrics, 'SYSTEM', 'TTFL', 'TTFL', 'MISSING RESULTS') == 1
+    assert metric(metrics, 'SYSTEM', 'TTFL', 'TTFL', 'ABS ERROR SUM') == 10 + 10 + 8 + 35
+    assert metric(metrics, 'PLAYER', 'James', 'TTFL', 'MISSING RESULTS') == 1
+
+
+def test_top_pick_hit_rate(monkeypatch):
+    monkeypatch.setattr(ps, 'TOP_PICKS', 2)
+    metrics = ps.compute_partition_metrics(PREDICTIONS, RESULTS)
+
+    # Predicted top 2: Jokic, Doncic. Realized top 2: Jokic, Doncic
+    assert metric(metrics, 'SYSTEM', 'TTFL', 'TTFL', 'TOP PICKS') == 2
+    assert metric(metrics, 'SYSTEM', 'TTFL', 'TTFL', 'TOP HITS') == 2
+    assert metric(metrics, 'TEAM', 'Denver Nuggets', 'TTFL', 'TOP PICKS') == 1
+    assert metric(metrics, 'PLAYER', 'Murray', 'TTFL', 'TOP PICKS') == 0
+
+
+def test_metrics_are_incremental_and_stored_with_their_state(tmp_path):
+    for day in ['2026-03-01', '2026-03-02']:
+        ps.append_predictions(day, PREDICTIONS, root=tmp_path)
+        ps.append_results(day, RESULTS, root=tmp_path)
+
+    assert len(ps.update_accuracy_metrics(root=tmp_path)) == 2
+    assert ps.update_accuracy_metrics(root=tmp_path) == []
+
+    metrics = ps.load_accuracy_metrics(root=tmp_path)
+    assert metric(metrics, 'SYSTEM', 'TTFL', 'TTFL', 'GAMES') == 8
+    assert metric(metrics, 'SYSTEM', 'TTFL', 'TTFL', 'MAE') == round(63 / 4, 2)
+
+    metrics_file = tmp_path / 'accuracy_metrics.parquet'
+    metadata = pq.read_schema(metrics_file).metadata
+    assert metadata[ps.METRICS_STATE_KEY] == b'["2026-03-01", "2026-03-02"]'
+    assert sorted(path.name for path in tmp_path.iterdir() if path.is_file()) == ['accuracy_metrics.parquet']
+
+
+def test_empty_slate_is_ingested(tmp_path):
+    ps.append_predictions('2026-02-15', PREDICTIONS.iloc[:0], root=tmp_path)
+    ps.append_results('2026-02-15', RESULTS.iloc[:0], root=tmp_path)
+
+    assert ps.update_accuracy_metrics(root=tmp_path) == [pd.Timestamp('2026-02-15').date()]
+    assert ps.update_accuracy_metrics(root=tmp_path) == []
+    assert ps.load_accuracy_metrics(root=tmp_path).empty
+
+
+def horizon(*days):
+    return pd.concat([PREDICTIONS.assign(Date=day) for day in days], ignore_index=True)
+
+
+def test_horizon_rewrite_drops_days_not_in_the_new_run(tmp_path):
+    ps.write_horizon_predictions(horizon('2026-03-02', '2026-03-03'), root=tmp_path)
+    ps.write_horizon_predictions(horizon('2026-03-02'), root=tmp_path)
+
+    assert ps.list_partition_dates(tmp_path) == [pd.Timestamp('2026-03-02').date()]
+
+
+def test_empty_horizon_keeps_existing_dataset(tmp_path):
+    ps.write_horizon_predictions(horizon('2026-03-02', '2026-03-03'), root=tmp_path)
+    with pytest.raises(ValueError):
+        ps.write_horizon_predictions(horizon('2026-03-02').iloc[:0], root=tmp_path)
+
+    assert len(ps.list_partition_dates(tmp_path)) == 2
+
+
+def test_range_reads_and_aggregates_selected_days(tmp_path):
+    ps.write_horizon_predictions(horizon('2026-03-02', '2026-03-03', '2026-03-05'), root=tmp_path)
+
+    df_range = ps.read_predictions_range('2026-03-02', '2026-03-04', root=tmp_path)
+    assert sorted(df_range['Date'].unique()) == [pd.Timestamp(day).date() for day in ['2026-03-02', '2026-03-03']]
+
+    df = ps.aggregate_predictions(df_range)
+    jokic = df[df['Player'] == 'Jokic'].iloc[0]
+    assert df.iloc[0]['Player'] == 'Jokic'
+    assert (jokic['Games'], jokic['Total Score TTFL'], jokic['Avg Score TTFL']) == (2, 100, 50)
+
+
+def test_range_skips_partition_pruned_while_reading(tmp_path, monkeypatch):
+    ps.write_horizon_predictions(horizon('2026-03-02', '2026-03-03'), root=tmp_path)
+    listed = ps.list_partition_dates(tmp_path)
+    ps.write_horizon_predictions(horizon('2026-03-02'), root=tmp_path)
+    monkeypatch.setattr(ps, 'list_partition_dates', lambda root: listed)
+
+    df_range = ps.read_predictions_range('2026-03-02', '2026-03-03', root=tmp_path)
+    assert df_range['Date'].unique().tolist() == [pd.Timestamp('2026-03-02').date()]
+
+
+def test_published_file_prefers_the_horizon_partition(tmp_path):
+    assert ps.published_predictions_file('2026-03-02', root=tmp_path) == ps.DAILY_PREDICTIONS_FILE
+
+    ps.write_horizon_predictions(horizon('2026-03-02'), root=tmp_path)
+    assert ps.published_predictions_file('2026-03-02', root=tmp_path) == str(
+        tmp_path / 'date=2026-03-02' / ps.PREDICTIONS_FILE
+    )